@@ -28,13 +28,15 @@ To Install:
 '''
 
 from __future__ import print_function
+import bisect
 import csv
 import errno
 import fnmatch
+import functools
 import os
 import re
+import string
 import sys
-import flame
 from PySide2 import QtCore
 from PySide2 import QtWidgets
 
@@ -53,6 +55,148 @@ HTML_TEMPLATE = 'template/template.html'
 HTML_FILENAME = 'copy_paster.html'
 SETUPS_ROOT = '/opt/Autodesk/project'
 
+# Precompiled patterns for PySlater.tidy_text().  Compiled once at import so
+# each call skips the re cache lookup.
+TIDY_EDGES = re.compile(r'^[\W_]+|[\W_]+$')
+TIDY_BODY = re.compile(r'([1-9]+):([1-9]+[0-9]*)|[\W_]+')
+
+# Translation table for PySlater.convert_output_tokens().  One C-level pass
+# instead of chained str.replace calls.
+TOKEN_TRANS = str.maketrans('<>', '{}')
+
+# Matches a TTG text line that holds a keyword wrapped in greater/less than
+# symbols aka angle brackets.  Angle brackets follow Flame convention for
+# tokens.  60 = < and 62 = >
+TTG_TOKEN = re.compile(r'Text 60 (?:\d+ )*62$')
+
+# Stylesheet for the whole window.  Set once on the main window so Qt parses
+# the QSS a single time instead of re-tokenizing a stylesheet per widget.
+# Each custom widget selects its rules with a flameRole dynamic property.
+STYLESHEET = '''
+    QWidget {background-color: #272727}
+    QPushButton[flameRole="normal"] {
+        color: rgb(154, 154, 154);
+        background-color: rgb(58, 58, 58);
+        border: none;
+        font: 14px "Discreet"}
+    QPushButton[flameRole="normal"]:hover {
+        border: 1px solid rgb(90, 90, 90)}
+    QPushButton[flameRole="normal"]:pressed {
+        color: rgb(159, 159, 159);
+        background-color: rgb(66, 66, 66);
+        border: 1px solid rgb(90, 90, 90)}
+    QPushButton[flameRole="normal"]:disabled {
+        color: rgb(116, 116, 116);
+        background-color: rgb(58, 58, 58);
+        border: none}
+    QPushButton[flameRole="blue"] {
+        color: rgb(190, 190, 190);
+        background-color: rgb(0, 110, 175);
+        border: none;
+        font: 12px "Discreet"}
+    QPushButton[flameRole="blue"]:hover {
+        border: 1px solid rgb(90, 90, 90)}
+    QPushButton[flameRole="blue"]:pressed {
+        color: rgb(159, 159, 159);
+        border: 1px solid rgb(90, 90, 90)}
+    QPushButton[flameRole="blue"]:disabled {
+        color: rgb(116, 116, 116);
+        background-color: rgb(58, 58, 58);
+        border: none}
+    QPushButton[flameRole="push"] {
+        color: rgb(154, 154, 154);
+        background-color: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: .93 rgb(58, 58, 58),
+            stop: .94 rgb(44, 54, 68));
+        text-align: left;
+        border-top: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: .93 rgb(58, 58, 58),
+            stop: .94 rgb(44, 54, 68));
+        border-bottom: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: .93 rgb(58, 58, 58),
+            stop: .94 rgb(44, 54, 68));
+        border-left: 1px solid rgb(58, 58, 58);
+        border-right: 1px solid rgb(44, 54, 68);
+        padding-left: 5px; font: 14px "Discreet"}
+    QPushButton[flameRole="push"]:checked {
+        color: rgb(217, 217, 217);
+        background-color: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: .93 rgb(71, 71, 71),
+            stop: .94 rgb(50, 101, 173));
+        text-align: left;
+        border-top: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: .93 rgb(71, 71, 71),
+            stop: .94 rgb(50, 101, 173));
+        border-bottom: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: .93 rgb(71, 71, 71),
+            stop: .94 rgb(50, 101, 173));
+        border-left: 1px solid rgb(71, 71, 71);
+        border-right: 1px solid rgb(50, 101, 173);
+        padding-left: 5px;
+        font: italic}
+    QPushButton[flameRole="push"]:hover {
+        border: 1px solid rgb(90, 90, 90)}
+    QPushButton[flameRole="push"]:disabled {
+        color: #6a6a6a;
+        background-color: qlineargradient(
+            x1: 0, y1: 0, x2: 1, y2: 0,
+            stop: .93 rgb(58, 58, 58),
+            stop: .94 rgb(50, 50, 50));
+        font: light;
+        border: none}
+    QLabel[flameRole="normal"] {
+        color: rgb(154, 154, 154);
+        font: 14px "Discreet"}
+    QLabel[flameRole="normal"]:disabled {
+        color: rgb(106, 106, 106)}
+    QLabel[flameRole="underline"] {
+        color: rgb(154, 154, 154);
+        border-bottom: 1px inset rgb(40, 40, 40);
+        font: 14px "Discreet"}
+    QLabel[flameRole="underline"]:disabled {
+        color: rgb(106, 106, 106)}
+    QLabel[flameRole="background"] {
+        color: rgb(154, 154, 154);
+        background-color: rgb(30, 30, 30);
+        padding-left: 5px;
+        font: 14px "Discreet"}
+    QLabel[flameRole="background"]:disabled {
+        color: rgb(106, 106, 106)}
+    QLineEdit[flameRole="edit"] {
+        color: rgb(154, 154, 154);
+        background-color: rgb(55, 65, 75);
+        selection-color: rgb(38, 38, 38);
+        selection-background-color: rgb(184, 177, 167);
+        border: 1px solid rgb(55, 65, 75);
+        padding-left: 5px;
+        font: 14px "Discreet"}
+    QLineEdit[flameRole="edit"]:focus {background-color: rgb(73, 86, 99)}
+    QLineEdit[flameRole="edit"]:hover {border: 1px solid rgb(90, 90, 90)}
+    QLineEdit[flameRole="edit"]:disabled {
+        color: rgb(106, 106, 106);
+        background-color: rgb(55, 55, 55);
+        border: 1px solid rgb(55, 55, 55)}
+    QLineEdit[flameRole="browse"] {
+        color: #898989;
+        background-color: #373e47;
+        font: 14px "Discreet"}
+    QLineEdit[flameRole="browse"][flamePressed="true"] {
+        color: #bbbbbb;
+        background-color: #474e58}
+    QLineEdit[flameRole="browse"]:disabled {
+        color: #6a6a6a;
+        background-color: #373737}
+    QToolTip {
+        color: rgb(170, 170, 170);
+        background-color: rgb(71, 71, 71);
+        border: 10px solid rgb(71, 71, 71)}'''
+
 
 class FlameButton(QtWidgets.QPushButton):
     '''
@@ -79,47 +223,7 @@ class FlameButton(QtWidgets.QPushButton):
         self.setMaximumSize(QtCore.QSize(button_max_width, 28))
         self.setFocusPolicy(QtCore.Qt.NoFocus)
         self.clicked.connect(connect)
-        if button_color == 'normal':
-            self.setStyleSheet('''
-                QPushButton {
-                    color: rgb(154, 154, 154);
-                    background-color: rgb(58, 58, 58);
-                    border: none;
-                    font: 14px "Discreet"}
-                QPushButton:hover {
-                    border: 1px solid rgb(90, 90, 90)}
-                QPushButton:pressed {
-                    color: rgb(159, 159, 159);
-                    background-color: rgb(66, 66, 66);
-                    border: 1px solid rgb(90, 90, 90)}
-                QPushButton:disabled {
-                    color: rgb(116, 116, 116);
-                    background-color: rgb(58, 58, 58);
-                    border: none}
-                QToolTip {
-                    color: rgb(170, 170, 170);
-                    background-color: rgb(71, 71, 71);
-                    border: 10px solid rgb(71, 71, 71)}''')
-        elif button_color == 'blue':
-            self.setStyleSheet('''
-                QPushButton {
-                    color: rgb(190, 190, 190);
-                    background-color: rgb(0, 110, 175);
-                    border: none;
-                    font: 12px "Discreet"}
-                QPushButton:hover {
-                    border: 1px solid rgb(90, 90, 90)}
-                QPushButton:pressed {
-                    color: rgb(159, 159, 159);
-                    border: 1px solid rgb(90, 90, 90)
-                QPushButton:disabled {
-                    color: rgb(116, 116, 116);
-                    background-color: rgb(58, 58, 58);
-                    border: none}
-                QToolTip {
-                    color: rgb(170, 170, 170);
-                    background-color: rgb(71, 71, 71);
-                    border: 10px solid rgb(71, 71, 71)}''')
+        self.setProperty('flameRole', button_color)
 
 
 class FlameGroupBox(QtWidgets.QGroupBox):
@@ -154,33 +258,12 @@ class FlameLabel(QtWidgets.QLabel):
         self.setMaximumHeight(28)
         self.setFocusPolicy(QtCore.Qt.NoFocus)
 
-        # Set label stylesheet based on label_type
+        # Label styling is selected from the window stylesheet by label_type
+
+        self.setProperty('flameRole', label_type)
 
-        if label_type == 'normal':
-            self.setStyleSheet('''
-                QLabel {
-                    color: rgb(154, 154, 154);
-                    font: 14px "Discreet"}
-                QLabel:disabled {
-                    color: rgb(106, 106, 106)}''')
-        elif label_type == 'underline':
+        if label_type == 'underline':
             self.setAlignment(QtCore.Qt.AlignCenter)
-            self.setStyleSheet('''
-                QLabel {
-                    color: rgb(154, 154, 154);
-                    border-bottom: 1px inset rgb(40, 40, 40);
-                    font: 14px "Discreet"}
-                QLabel:disabled {
-                    color: rgb(106, 106, 106)}''')
-        elif label_type == 'background':
-            self.setStyleSheet('''
-                QLabel {
-                    color: rgb(154, 154, 154);
-                    background-color: rgb(30, 30, 30);
-                    padding-left: 5px;
-                    font: 14px "Discreet"}
-                QLabel:disabled {
-                    color: rgb(106, 106, 106)}''')
 
 
 class FlameLineEdit(QtWidgets.QLineEdit):
@@ -206,25 +289,7 @@ class FlameLineEdit(QtWidgets.QLineEdit):
         self.setMinimumWidth(width)
         self.setMaximumWidth(max_width)
         self.setFocusPolicy(QtCore.Qt.ClickFocus)
-        self.setStyleSheet('''
-            QLineEdit {
-                color: rgb(154, 154, 154);
-                background-color: rgb(55, 65, 75);
-                selection-color: rgb(38, 38, 38);
-                selection-background-color: rgb(184, 177, 167);
-                border: 1px solid rgb(55, 65, 75);
-                padding-left: 5px;
-                font: 14px "Discreet"}
-            QLineEdit:focus {background-color: rgb(73, 86, 99)}
-            QLineEdit:hover {border: 1px solid rgb(90, 90, 90)}
-            QLineEdit:disabled {
-                color: rgb(106, 106, 106);
-                background-color: rgb(55, 55, 55);
-                border: 1px solid rgb(55, 55, 55)}
-            QToolTip {
-                color: rgb(170, 170, 170);
-                background-color: rgb(71, 71, 71);
-                border: none}''')
+        self.setProperty('flameRole', 'edit')
 
 
 class FlameLineEditFileBrowse(QtWidgets.QLineEdit):
@@ -258,34 +323,21 @@ class FlameLineEditFileBrowse(QtWidgets.QLineEdit):
         self.setReadOnly(True)
         self.setFocusPolicy(QtCore.Qt.NoFocus)
         self.clicked.connect(self.file_browse)
-        self.setStyleSheet('''
-            QLineEdit {
-                color: #898989;
-                background-color: #373e47;
-                font: 14px "Discreet"}
-            QLineEdit:disabled {
-                color: #6a6a6a;
-                background-color: #373737}''')
+        self.setProperty('flameRole', 'browse')
+
+    def set_pressed(self, pressed):
+        '''Toggle the flamePressed property and repolish so the window
+        stylesheet picks up the pressed styling.'''
+
+        self.setProperty('flamePressed', pressed)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
-            self.setStyleSheet('''
-                QLineEdit {
-                    color: #bbbbbb;
-                    background-color: #474e58;
-                    font: 14px "Discreet"}
-                QLineEdit:disabled {
-                    color: #6a6a6a;
-                    background-color: #373737}''')
+            self.set_pressed(True)
             self.clicked.emit()
-            self.setStyleSheet('''
-                QLineEdit {
-                    color: #898989;
-                    background-color: #373e47;
-                    font: 14px "Discreet"}
-                QLineEdit:disabled {
-                    color: #6a6a6a;
-                    background-color: #373737}''')
+            self.set_pressed(False)
         else:
             super().mousePressEvent(event)
 
@@ -339,57 +391,93 @@ class FlamePushButton(QtWidgets.QPushButton):
         self.setFocusPolicy(QtCore.Qt.NoFocus)
         self.setMinimumSize(150, 28)
         self.setMaximumSize(150, 28)
-        self.setStyleSheet('''
-            QPushButton {
-                color: rgb(154, 154, 154);
-                background-color: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: .93 rgb(58, 58, 58),
-                    stop: .94 rgb(44, 54, 68));
-                text-align: left;
-                border-top: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: .93 rgb(58, 58, 58),
-                    stop: .94 rgb(44, 54, 68));
-                border-bottom: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: .93 rgb(58, 58, 58),
-                    stop: .94 rgb(44, 54, 68));
-                border-left: 1px solid rgb(58, 58, 58);
-                border-right: 1px solid rgb(44, 54, 68);
-                padding-left: 5px; font: 14px "Discreet"}
-            QPushButton:checked {
-                color: rgb(217, 217, 217);
-                background-color: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: .93 rgb(71, 71, 71),
-                    stop: .94 rgb(50, 101, 173));
-                text-align: left;
-                border-top: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: .93 rgb(71, 71, 71),
-                    stop: .94 rgb(50, 101, 173));
-                border-bottom: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: .93 rgb(71, 71, 71),
-                    stop: .94 rgb(50, 101, 173));
-                border-left: 1px solid rgb(71, 71, 71);
-                border-right: 1px solid rgb(50, 101, 173);
-                padding-left: 5px;
-                font: italic}
-            QPushButton:hover {border: 1px solid rgb(90, 90, 90)}'
-            QPushButton:disabled {
-                color: #6a6a6a;
-                background-color: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: .93 rgb(58, 58, 58),
-                    stop: .94 rgb(50, 50, 50));
-                font: light;
-                border: none}
-            QToolTip {
-                color: rgb(170, 170, 170);
-                background-color: rgb(71, 71, 71);
-                border: 10px solid rgb(71, 71, 71)}''')
+        self.setProperty('flameRole', 'push')
+
+
+# Template rows shared across PySlater instances, keyed by path and keepends
+# with the file modification time stored alongside the rows.
+TEMPLATE_CACHE = {}
+
+# Decoded TTG keyword dicts keyed by template path, with the modification
+# time stored alongside, so repeat runs skip re-decoding the keywords.
+KEYWORD_CACHE = {}
+
+
+def read_template(path, keepends=False):
+    '''Read a template file and return its lines as a tuple.
+
+    Cached by path and modification time so batch runs that share a template
+    only open and split the file once per PySlater instance, while edits to
+    the template on disk are still picked up.'''
+
+    mtime = os.stat(path).st_mtime_ns
+    cached = TEMPLATE_CACHE.get((path, keepends))
+
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, encoding='utf-8', newline='') as open_file:
+        rows = tuple(open_file.read().splitlines(keepends))
+
+    TEMPLATE_CACHE[(path, keepends)] = (mtime, rows)
+
+    return rows
+
+
+class RangeSet(object):
+    '''Numbers listed in range notation and/or single numbers separated by
+    commas, stored as (low, high) spans.
+
+    Only the span endpoints are kept instead of expanding every number, so a
+    range such as '1-10000' costs two ints rather than ten thousand.
+    Membership is answered by bisecting the sorted, merged spans.
+
+    Attributes:
+        spans:
+            A list of (low, high) tuples, sorted and non-overlapping.
+
+    Usage:
+
+        rows = RangeSet('1,3-17,87')
+        5 in rows
+    '''
+
+    __slots__ = ('spans',)
+
+    def __init__(self, notation=None):
+
+        raw_spans = []
+
+        for element in notation.split(',') if notation else []:
+            parts = [int(x) for x in element.split('-')]
+            raw_spans.append((min(parts), max(parts)))
+
+        # Merge overlapping or touching spans so bisecting stays valid.
+        self.spans = []
+
+        for low, high in sorted(raw_spans):
+            if self.spans and low <= self.spans[-1][1] + 1:
+                self.spans[-1] = (self.spans[-1][0], max(self.spans[-1][1], high))
+            else:
+                self.spans.append((low, high))
+
+    def __bool__(self):
+
+        return bool(self.spans)
+
+    def __contains__(self, number):
+
+        index = bisect.bisect_right(self.spans, (number, float('inf'))) - 1
+
+        return index >= 0 and self.spans[index][1] >= number
+
+    def offset(self, offset):
+        '''Returns a new RangeSet with every span shifted by the given amount.'''
+
+        shifted = RangeSet()
+        shifted.spans = [(low + offset, high + offset) for low, high in self.spans]
+
+        return shifted
 
 
 class PySlater(object):
@@ -447,16 +535,20 @@ class PySlater(object):
         self.html = html
         self.message = message or print
         self.row_header = row_header  # index based on 1
-        self.row_include = self.expand_row_notation(row_include) if row_include else []
-        self.row_exclude = self.expand_row_notation(row_exclude) if row_exclude else []
+        self.row_include = RangeSet(row_include)
+        self.row_exclude = RangeSet(row_exclude)
         self.skip_existing = skip_existing
         self.template_html = template_html or self.get_template_html()
         self.template_ttg = template_ttg
 
         # Generated Args at self.run()
         self.csv_rows = ()
+        self.headers = ()
+        self.dir_cache = {}
+        self.mkdir_cache = set()
+        self.msg_buf = []
         self.filepath_pattern = ''
-        self.template_ttg_rows = []  # why is this not a tuple too?
+        self.template_ttg_rows = ()
         self.template_ttg_keywords = {}
 
         # Args for each Slate
@@ -465,6 +557,7 @@ class PySlater(object):
         self.row = []
         self.row_number = 0
         self.ttg_replacements = {}
+        self.line_replacements = []
 
         # HTML Args
         self.template_html_rows = ()
@@ -475,24 +568,76 @@ class PySlater(object):
 
     @staticmethod
     def common_path(paths):
-        '''Returns common parent directory from list of paths.
-        Not necessary in Python 3.5 because of os.path.commonpath()'''
+        '''Returns common parent directory from list of paths.'''
+
+        if not paths:
+            return ''
+        if len(paths) == 1:
+            return os.path.dirname(paths[0])
 
-        return os.path.dirname(os.path.commonprefix(paths))
+        common = os.path.commonpath(paths)
+
+        # When every path is identical, commonpath returns the file itself,
+        # so step up to its directory.
+        if common in paths:
+            common = os.path.dirname(common)
+
+        return common
 
     @staticmethod
     def convert_from_ttg_text(decimal_string):
         '''Returns unicode standard string minus the 'Text' at the beginning
        and the <> keyword wrappers'''
 
-        return ''.join(chr(int(character)) for character in
-                       decimal_string.split()[2:-1])
+        return ''.join(map(chr, map(int, decimal_string.split()[2:-1])))
 
     @staticmethod
     def convert_to_ttg_text(string):
         '''Returns TTG style string'''
 
-        return ' '.join(str(ord(character)) for character in list(string))
+        return ' '.join(map(str, map(ord, string)))
+
+    @staticmethod
+    def assemble_path(fmt_parts, columns, keywords):
+        '''Fill a pre-parsed output pattern from the column list and the
+        keyword dict.
+
+        Equivalent to calling str.format on the original pattern, but works
+        from the parsed (literal, field, spec, conversion) tuples so the
+        pattern is not re-parsed for every row.  Raises IndexError or
+        KeyError like format() when a field is missing.'''
+
+        parts = []
+        auto_index = 0
+
+        for literal, field, format_spec, _conversion in fmt_parts:
+            parts.append(literal)
+            if field is None:
+                continue
+            if field == '':
+                value = columns[auto_index]
+                auto_index += 1
+            elif field.isdigit():
+                value = columns[int(field)]
+            else:
+                value = keywords[field]
+            parts.append(format(value, format_spec) if format_spec else
+                         value if isinstance(value, str) else str(value))
+
+        return ''.join(parts)
+
+    @staticmethod
+    def compile_filters(patterns):
+        '''Compile a list of fnmatch patterns into one alternation regex.
+
+        Returns None when there are no patterns.  One compiled match per
+        path replaces a fnmatch call per pattern per path.'''
+
+        if not patterns:
+            return None
+
+        return re.compile('|'.join('(?:%s)' % fnmatch.translate(pattern)
+                                   for pattern in patterns))
 
     @staticmethod
     def filename_no_ext(filepath):
@@ -504,35 +649,16 @@ class PySlater(object):
     def find_ttg_keywords(ttg_file_list):
         '''Returns dictionary containing the line number and contents
         for the keywords that are wrapped in greater/less than symbols aka
-        angle brackets.  Angle brackets follow Flame convention for tokens.
-        60 = <
-        62 = >
+        angle brackets.  Matching is done with the precompiled TTG_TOKEN
+        pattern, one C-level scan per line.
 
         NOTE - will return empty dictionary if ttg_file_list is empty list.'''
 
         return {line: text for line, text in enumerate(ttg_file_list, 1) if
-                text.startswith('Text 60') and text.endswith('62')}
-
-    @staticmethod
-    def expand_row_notation(string):
-        '''Expand numbers listed in range notation and/or single numbers
-        separated by commas into a single list.
-        Copied from https://gist.github.com/kgaughan/2491663
-        '''
-
-        single_frames = set()
-
-        for element in string.split(','):
-            parts = [int(x) for x in element.split('-')]
-            if len(parts) == 1:
-                single_frames.add(parts[0])
-            else:
-                for frame in range(min(parts), max(parts) + 1):
-                    single_frames.add(frame)
-
-        return list(single_frames)
+                TTG_TOKEN.match(text)}
 
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def get_script_path():
         '''Returns the path to this script file.  Copied from
         https://stackoverflow.com/questions/918154/relative-paths-in-python'''
@@ -568,13 +694,13 @@ class PySlater(object):
         '''Returns string that is appropriate for filename usage.'''
 
         # Chop first and last character if a symbol or space.
-        chopped = re.sub(r'^[\W_]+|[\W_]+$', '', text)
-        # Swap aspect ratios using colons such as 1:1 to 1x1
-        swapped = re.sub(r'([1-9]+):([1-9]+[0-9]*)', r'\1x\2', chopped)
-        # Santize symbols & whitespace to underscores.
-        sanitized = re.sub(r'\W+', '_', swapped)
-        # Tidy up duplicate underscores.
-        tidy = re.sub(r'(_)\1+', '_', sanitized)
+        chopped = TIDY_EDGES.sub('', text)
+        # Single fused pass over the remainder.  Swap aspect ratios using
+        # colons such as 1:1 to 1x1, otherwise sanitize runs of symbols &
+        # whitespace to a single underscore.
+        tidy = TIDY_BODY.sub(
+            lambda match: match.group(1) + 'x' + match.group(2) if match.group(1)
+            else '_', chopped)
 
         return tidy
 
@@ -596,6 +722,28 @@ class PySlater(object):
 
         return result
 
+    def isfile_cached(self, filepath):
+        '''Test whether filepath already exists against a snapshot of its
+        directory.
+
+        Slates typically land many to a folder, so one os.scandir per
+        destination directory replaces a stat syscall per file.  Files
+        written during the run are added to the snapshot to keep it
+        consistent.'''
+
+        dirpath, filename = os.path.split(filepath)
+
+        try:
+            names = self.dir_cache[dirpath]
+        except KeyError:
+            try:
+                names = {entry.name for entry in os.scandir(dirpath)}
+            except OSError:  # destination folder does not exist yet
+                names = set()
+            self.dir_cache[dirpath] = names
+
+        return filename in names
+
     def convert_output_tokens(self, path):
         '''Convert <> to {}
         Flame convention for tokens is <>. Python uses {} for string formatting.
@@ -605,8 +753,7 @@ class PySlater(object):
             if not path:  # Catch empty string
                 raise ValueError
 
-            path = path.replace('<', '{').replace('>', '}')
-            return path
+            return path.translate(TOKEN_TRANS)
         except ValueError:
             self.message('Output argument cannot be empty!')
             return None
@@ -624,12 +771,10 @@ class PySlater(object):
         '''Return contents of TTG file.'''
 
         try:
-            with open(self.template_ttg, 'r', encoding='utf-8') as open_file:
-                contents = open_file.read().splitlines()
-                return contents
+            return read_template(self.template_ttg)
         except FileNotFoundError:
             self.message('TTG Template file not found!')
-            return []
+            return ()
         except Exception as exception:
             raise exception
 
@@ -638,10 +783,7 @@ class PySlater(object):
 
         try:
             with open(self.csv_file, encoding='utf-8', newline='') as open_file:
-                raw_rows = csv.reader(open_file)
-                unicode_rows = list(raw_rows)
-
-            return tuple(unicode_rows)
+                return tuple(csv.reader(open_file))
 
         except IOError:
             self.message('CSV file not found!')
@@ -659,20 +801,41 @@ class PySlater(object):
     def get_ttg_keywords(self):
         '''return a dictionary with line numbers and keywords converted to unicode.'''
 
+        # The template cache entry carries the mtime the rows were read at,
+        # so reuse it to decide whether the decoded keywords are current.
+        cached_rows = TEMPLATE_CACHE.get((self.template_ttg, False))
+
+        if cached_rows:
+            cached_keywords = KEYWORD_CACHE.get(self.template_ttg)
+            if cached_keywords and cached_keywords[0] == cached_rows[0]:
+                return cached_keywords[1]
+
         ttg_keywords = self.find_ttg_keywords(self.template_ttg_rows)
         ttg_keywords_unicode = {index: self.convert_from_ttg_text(raw_string) for
-                                index, raw_string in list(ttg_keywords.items())}
+                                index, raw_string in ttg_keywords.items()}
+
+        if cached_rows:
+            KEYWORD_CACHE[self.template_ttg] = (cached_rows[0], ttg_keywords_unicode)
 
         return ttg_keywords_unicode
 
     def message_row(self, *args):
-        '''Prints out message and pads the row number.'''
+        '''Buffers a message prefixed with the padded row number.
+
+        Messages are buffered per row and forwarded in one flush_messages
+        call, so chatty runs do not pay a message dispatch (and in the GUI, a
+        widget repaint) per line.'''
+
+        prefix = ('Row', str(self.row_number + 1).zfill(2), '-')
+
+        self.msg_buf.append(' '.join(prefix + args))
 
-        row_num = ['Row', str(self.row_number + 1).zfill(2)]
-        divider = ['-']
-        message_elements = row_num + divider + list(args)
+    def flush_messages(self):
+        '''Forward the buffered row messages in a single message call.'''
 
-        self.message(' '.join(list(message_elements)))
+        if self.msg_buf:
+            self.message('\n'.join(self.msg_buf))
+            del self.msg_buf[:]
 
     def write_ttg(self):
         '''
@@ -687,49 +850,79 @@ class PySlater(object):
         Args:
             self.filepath:
                 A string of the full destination path and filename.
-            self.ttg_replacements:
-                A dictionary of replacements and their destination line numbers.
+            self.line_replacements:
+                A list of replacement text indexed by line number, None where
+                the line holds no token.
             self.ttg_file_list:
                 The template ttg stored a tuple of lines.
             self.template_ttg_keywords:
                 Dictionary of the keywords in the template and their line number.
                 Example {12:'Title'}
+
+        Returns:
+            False if the file already existed and was skipped, otherwise True.
         '''
 
+        # Bind the loop invariants to locals to keep attribute lookups out of
+        # the per-line hot loop.
+        keywords = self.template_ttg_keywords
+        line_replacements = self.line_replacements
+        convert = self.convert_to_ttg_text
+
+        # Accumulate output lines and write the file in one call instead of
+        # two or three buffered writes per template line.
+        out = []
+        append = out.append
+
+        # Run through TTG template line by line
+        for line_number, text in enumerate(self.template_ttg_rows, 1):
+            # If the following line includes a token
+            new_text = line_replacements[line_number + 1]
+            if new_text is not None:
+                # TTG format precedes the actual text with a TextLength detail
+                new_ttg_text = convert(new_text)
+                # Write out the line before the token and the following line
+                # that actually contains the token
+                append('TextLength ' + str(len(new_ttg_text.split())) + '\n')
+                append('Text ' + new_ttg_text + '\n')
+            elif line_number in keywords:
+                continue
+            else:
+                append(text + '\n')
+
+        # Open exclusively in skip mode so an existing file is detected by
+        # the open call itself instead of a separate stat beforehand.
+        mode = 'x' if self.skip_existing and not self.force_overwrite else 'w'
+
         try:
-            with open(self.filepath, 'w', encoding='utf-8') as ttg:
-                # Run through TTG template line by line
-                for line_number, text in enumerate(self.template_ttg_rows, 1):
-                    # If the following line includes a token
-                    if line_number + 1 in self.template_ttg_keywords:
-                        # Take the following line number, find the keyword associated
-                        # with that line, run that keyword through the dictionary of
-                        # replacements.
-                        try:
-                            new_text = self.ttg_replacements[
-                                self.template_ttg_keywords[line_number + 1]]
-                        # If the token does not exist in the CSV
-                        except KeyError:
-                            new_text = ''
-                        # TTG format precedes the actual text with a TextLength detail
-                        new_ttg_text = self.convert_to_ttg_text(new_text)
-                        # Write out the line before the token and the following line
-                        # that actually contains the token
-                        ttg.write('TextLength ' + str(len(new_ttg_text.split())) + '\n')
-                        ttg.write('Text ' + new_ttg_text + '\n')
-                    elif line_number in self.template_ttg_keywords:
-                        continue
-                    else:
-                        ttg.write(text + '\n')
+            with open(self.filepath, mode, encoding='utf-8') as ttg:
+                # In skip mode the write is only certain once the exclusive
+                # open succeeds, so the message waits until here.
+                if mode == 'x':
+                    self.message_row('Writing out', self.filepath)
+                ttg.write(''.join(out))
+        except FileExistsError:
+            self.message_row('Skipping', self.filepath)
+            return False
         except IOError:
+            # Show the buffered row context before the error so the message
+            # lands under the row it belongs to.
+            self.flush_messages()
             self.message('Skipping! Cannot write to this path.')
+            return True
+
+        # Keep the directory snapshot current for later rows, now that the
+        # file really exists.
+        dirpath, filename = os.path.split(self.filepath)
+        self.dir_cache.setdefault(dirpath, set()).add(filename)
+
+        return True
 
     def read_html_template(self):
         '''Read in HTML template file.  Return tuple of file lines or empty tuple.'''
 
         try:
-            with open(self.template_html, encoding='utf-8', newline='') as file:
-                self.template_html_rows = file.readlines()
+            self.template_html_rows = read_template(self.template_html, keepends=True)
 
         except IOError:
             self.message('HTML template file not found!')
@@ -745,157 +938,265 @@ class PySlater(object):
         Args:
             self.template_html_rows: '''
 
-        html_line = '''  <button
-        data-clipboard-text=\"master_name_goes_here\">master_name_goes_here</button>'''
+        html_line = ('  <button\n'
+                     '        data-clipboard-text="{0}">{0}</button>\n')
 
         if self.template_html_rows:
+            # Assemble the whole page in memory and write it in one call.
+            # format() fills both copies of the name in one pass instead of
+            # two replace() scans per entry.
+            rows = self.template_html_rows
+            target = line_number_to_replace - 1
+            buttons = ''.join(html_line.format(entry) for entry in
+                              list_of_replacements)
+            page = ''.join(rows[:target]) + buttons + ''.join(rows[target + 1:])
+
             with open(self.destination_html, 'w', encoding='utf-8') as destination_file:
-                for line_number, line in enumerate(self.template_html_rows, 1):
-                    if line_number == line_number_to_replace:
-                        for entry in list_of_replacements:
-                            destination_file.write(
-                                    html_line.replace(
-                                        'master_name_goes_here', entry) + '\n')
-                    else:
-                        destination_file.write(line)
+                destination_file.write(page)
 
     def run(self):
         '''Generate the slates!'''
 
         self.csv_rows = self.read_unicode_csv_file()
+        # Capture the header row once so the per-row lookups below do not
+        # re-index the full row tuple.
+        # Intern the header strings.  They serve as dict keys for every row,
+        # so interned keys make each lookup an identity compare instead of a
+        # character-by-character hash and equality check.  A header row
+        # beyond the CSV simply yields no headers rather than an IndexError.
+        if self.csv_rows and self.row_header <= len(self.csv_rows):
+            self.headers = tuple(sys.intern(header) for header in
+                                 self.csv_rows[self.row_header - 1])
+        else:
+            self.headers = ()
         self.filepath_pattern = self.convert_output_tokens(self.output)
-        self.template_ttg_rows = self.read_ttg_file() if self.template_ttg else []
+        self.template_ttg_rows = self.read_ttg_file() if self.template_ttg else ()
         self.template_ttg_keywords = self.get_ttg_keywords() if self.template_ttg else {}
 
         # Print info for TTG template keywords
         if self.template_ttg_keywords:
             self.message('Found %s keywords in %s:' % (len(self.template_ttg_keywords),
                                                        self.template_ttg))
-            self.message(', '.join([keyword for _, keyword in
-                                    list(self.template_ttg_keywords.items())]))
+            self.message(', '.join(self.template_ttg_keywords.values()))
 
         # Print info for CSV file
         if self.csv_rows:
             self.message('Found %s rows in %s' % (len(self.csv_rows), self.csv_file))
 
+        # Hoist the loop-invariant row masks.  Row notation is an index of 1;
+        # the enumerate below is an index of 0.
+        row_exclude = self.row_exclude.offset(-1)
+        row_include = self.row_include.offset(-1)
+
+        # Compile the filename filters once instead of translating each
+        # pattern again for every row.
+        filter_exclude_re = self.compile_filters(self.filter_exclude)
+        filter_include_re = self.compile_filters(self.filter_include)
+
+        # The first row supplies the keywords for the output path tokens and
+        # is loop-invariant, so bind it once, interned for the same reason as
+        # self.headers above.
+        headers0 = (tuple(sys.intern(header) for header in self.csv_rows[0])
+                    if self.csv_rows else ())
+        headers0_count = len(headers0)
+
+        # Parse the output pattern once.  str.format would re-parse the
+        # format string for every row.  Interning the field names pairs them
+        # with the interned header keys they are looked up against.
+        fmt_parts = (tuple((literal, sys.intern(field) if field else field,
+                            format_spec, conversion)
+                           for literal, field, format_spec, conversion
+                           in string.Formatter().parse(self.filepath_pattern))
+                     if self.filepath_pattern else ())
+
+        # Slate CSVs repeat categorical values heavily, so tidy each
+        # distinct cell value once and reuse the cleaned string.
+        tidy_cache = {}
+
+        def tidy(text):
+            try:
+                return tidy_cache[text]
+            except KeyError:
+                tidy_cache[text] = tidied = self.tidy_text(text)
+                return tidied
+
+        # Bind the remaining per-row attribute lookups to locals so the loop
+        # body runs on LOAD_FAST instead of LOAD_ATTR dispatch.  Attributes
+        # that change during the loop (force_overwrite, skip_existing) are
+        # deliberately left unbound.
+        message_row = self.message_row
+        assemble_path = self.assemble_path
+        filename_no_ext = self.filename_no_ext
+        results_append = self.results.append
+        header_row = self.row_header - 1
+        has_ttg = bool(self.template_ttg_keywords)
+
+        # The HTML page wants the extensionless basenames of the results, and
+        # each one is already computed for the Proceeding message, so collect
+        # them as the rows go by instead of re-splitting every path later.
+        ttg_filenames = []
+        basenames_append = ttg_filenames.append
+
         for self.row_number, self.row in enumerate(self.csv_rows):
 
-            # Check for empty row
-            if all(i == u'' for i in self.row):
-                self.message_row('Skipping - Empty row')
+            # Flush the previous row's buffered messages
+            self.flush_messages()
+
+            # Check for empty row.  Cells are strings, so any() short
+            # circuits on the first non-empty one in a single C-level pass.
+            if not any(self.row):
+                message_row('Skipping - Empty row')
                 continue
 
             # Skip the header row
-            if (self.row_header - 1) == self.row_number:
-                self.message_row('Skipping - Header row')
+            if header_row == self.row_number:
+                message_row('Skipping - Header row')
                 continue
 
             # Check for excluded rows
-            if self.row_exclude:
-                if self.row_number in self.list_offset(self.row_exclude, -1):
-                    self.message_row('Skipping - Row excluded')
+            if row_exclude:
+                if self.row_number in row_exclude:
+                    message_row('Skipping - Row excluded')
                     continue
 
             # Check for included rows
-            if self.row_include:
-                if self.row_number not in self.list_offset(self.row_include, -1):
-                    self.message_row('Skipping - Row not included')
+            if row_include:
+                if self.row_number not in row_include:
+                    message_row('Skipping - Row not included')
                     continue
 
-            # Assemble replacement entries for output path
-            filepath_replacements = {'column': [], 'keyword': {}}
-
-            filepath_replacements['column'] = [None if item == u'' else
-                                               self.tidy_text(item) for item in
-                                               self.row]
-
-            filepath_replacements['keyword'] = {keyword: self.tidy_text(entry) for
-                                                keyword, entry in zip(self.csv_rows[0],
-                                                                      self.row)
-                                                if entry != u''}
+            # Assemble replacement entries for the output path in a single
+            # pass over the row, reusing the tidied string for both the
+            # column list and the keyword dict.
+            columns = []
+            keywords = {}
+
+            for index, entry in enumerate(self.row):
+                if entry == u'':
+                    columns.append(None)
+                else:
+                    tidied = tidy(entry)
+                    columns.append(tidied)
+                    if index < headers0_count:
+                        keywords[headers0[index]] = tidied
 
             # Check output file path has all necessary entries
             try:
-                self.filepath = self.filepath_pattern.format(
-                        * filepath_replacements['column'],
-                        ** filepath_replacements['keyword'])
+                self.filepath = assemble_path(fmt_parts, columns, keywords)
 
             except (IndexError, KeyError):
-                self.message_row('Skipping - Could not assemble output path.')
+                message_row('Skipping - Could not assemble output path.')
                 continue
 
             # Check output filename against filter exclude
-            if self.filter_exclude:
-                if True in [fnmatch.fnmatch(self.filepath, arg) for arg in
-                            self.filter_exclude]:
-                    self.message_row(self.filepath, 'matches exclude filter')
-                    self.message_row('Skipping', self.filepath)
+            if filter_exclude_re:
+                if filter_exclude_re.match(self.filepath):
+                    message_row(self.filepath, 'matches exclude filter')
+                    message_row('Skipping', self.filepath)
                     continue
 
             # Check output filename against include argument
-            if self.filter_include:
-                if not any(fnmatch.fnmatch(self.filepath, arg)
-                           for arg in self.filter_include):
-                    self.message_row(self.filepath, 'does not match include filter')
-                    self.message_row('Skipping', self.filepath)
+            if filter_include_re:
+                if not filter_include_re.match(self.filepath):
+                    message_row(self.filepath, 'does not match include filter')
+                    message_row('Skipping', self.filepath)
                     continue
 
-            self.message_row('Proceeding with', self.filename_no_ext(self.filepath))
-
-            # Check for overwrite
-            if self.template_ttg_keywords:
-                exists = os.path.isfile(self.filepath)
-
-                if exists:
-                    self.message_row('Warning!', self.filepath, 'already exists!')
-
-                if exists and self.force_overwrite:
-                    pass
-                if exists and self.skip_existing:
-                    self.message_row('Skipping', self.filepath)
-                    continue
-                if exists and not self.force_overwrite and not self.skip_existing:
-                    self.reply = self.overwrite_query()
-
-                    # Overwrite responses
-                    if self.reply and self.reply == 'y':
-                        pass
-                    if self.reply and self.reply == 'n':
-                        self.message_row('Skipping', self.filepath)
+            basename = filename_no_ext(self.filepath)
+            message_row('Proceeding with', basename)
+
+            # Overwrite check and TTG write.  Both only apply when the
+            # template had keywords, so gate them behind one test.
+            if has_ttg:
+                # Check for overwrite.  Once overwriting or skipping has been
+                # decided for the whole run, existence is left to the open
+                # call in write_ttg instead of a stat per row here.  Dry runs
+                # never reach that open, so keep the check there for an
+                # accurate skip preview.
+                if (self.dry_run and self.skip_existing
+                        and not self.force_overwrite):
+                    if self.isfile_cached(self.filepath):
+                        message_row('Skipping', self.filepath)
                         continue
-                    if self.reply and self.reply == 'Y':
-                        self.force_overwrite = True
-                    if self.reply and self.reply == 'N':
-                        self.skip_existing = True
+                if not (self.force_overwrite or self.skip_existing):
+                    if self.isfile_cached(self.filepath):
+                        message_row('Warning!', self.filepath, 'already exists!')
+
+                        # Show the warning before prompting
+                        self.flush_messages()
+                        self.reply = self.overwrite_query()
+
+                        # Overwrite responses.  A reply of y simply falls
+                        # through to the write.
+                        if self.reply == 'n':
+                            message_row('Skipping', self.filepath)
+                            continue
+                        if self.reply == 'N':
+                            self.skip_existing = True
+                            continue
+                        if self.reply == 'Y':
+                            self.force_overwrite = True
+
+                # Start writing out TTGs.  In skip mode the exclusive open
+                # in write_ttg decides whether a write happens, so it
+                # reports Writing out itself once the open succeeds.
+                if (self.dry_run or self.force_overwrite
+                        or not self.skip_existing):
+                    message_row('Writing out', self.filepath)
+
+                if not self.dry_run:
+                    # Assemble dict using header row for keys and raw row
+                    # entries for the replacements.  The slate text gets the
+                    # raw CSV values, unlike the tidied strings used for the
+                    # filename, and is only assembled when a write actually
+                    # happens.
+                    self.ttg_replacements = dict(zip(self.headers, self.row))
+
+                    # Flatten the per-line lookups for write_ttg into a list
+                    # indexed by line number.  Keywords missing from the CSV
+                    # get an empty replacement; lines without a token get
+                    # None.
+                    self.line_replacements = (
+                        [None] * (len(self.template_ttg_rows) + 2))
+                    for line, keyword in self.template_ttg_keywords.items():
+                        self.line_replacements[line] = (
+                            self.ttg_replacements.get(keyword, ''))
+
+                    dirpath = os.path.dirname(self.filepath)
+                    # Make output path if necessary, once per directory
+                    if dirpath not in self.mkdir_cache:
+                        self.makedirs(self.filepath)
+                        self.mkdir_cache.add(dirpath)
+                    if not self.write_ttg():
                         continue
 
-            # Start writing out TTGs
-            if self.template_ttg_keywords:
-                self.message_row('Writing out', self.filepath)
-
-                # Assemble dict using header row for keys and row entries for the
-                # replacements
-                self.ttg_replacements = dict(zip(self.csv_rows[self.row_header - 1],
-                                                 self.csv_rows[self.row_number]))
-            if self.template_ttg_keywords and not self.dry_run:
-                self.makedirs(self.filepath)  # Make output path if necessary
-                self.write_ttg()
-
             # Append to results
-            self.results.append(self.filepath)
+            results_append(self.filepath)
+            basenames_append(basename)
+
+        self.flush_messages()
 
         # HTML Copy Paster
         if self.csv_rows and self.html:
-            self.destination_html = os.path.join(self.common_path(self.results),
-                                                 HTML_FILENAME)
-            ttg_filenames = [self.filename_no_ext(i) for i in self.results]
+            # When the directory part of the output pattern holds no tokens,
+            # every slate lands in that directory, so the O(N) common path
+            # scan over the results can be skipped.
+            pattern_dir = os.path.dirname(self.filepath_pattern or '')
+
+            if self.results and '{' not in pattern_dir:
+                common = pattern_dir
+            else:
+                common = self.common_path(self.results)
+
+            self.destination_html = os.path.join(common, HTML_FILENAME)
 
             self.read_html_template()
 
             if not self.dry_run:
                 if self.template_html_rows:
                     self.message(' '.join(['Writing out', self.destination_html]))
-                    self.makedirs(self.destination_html)
+                    if os.path.dirname(self.destination_html) not in self.mkdir_cache:
+                        self.makedirs(self.destination_html)
                     self.write_html_page(40, ttg_filenames)
                     self.results.append(self.destination_html)
 
@@ -945,7 +1246,7 @@ class PySlaterWindow(object):
     def message_shell(info):
         '''Print message to shell window and append global MESSAGE_PREFIX.'''
 
-        sys.stdout.write(MESSAGE_PREFIX + ' ' + info + '\n')
+        sys.stdout.write('%s %s\n' % (MESSAGE_PREFIX, info))
 
     @staticmethod
     def copy_to_clipboard(text):
@@ -964,7 +1265,13 @@ class PySlaterWindow(object):
 
     @staticmethod
     def get_project_name():
-        '''Return name of current Autodesk Flame project.'''
+        '''Return name of current Autodesk Flame project.
+
+        The flame module is only importable inside the Flame application, so
+        it is imported here instead of at module level.  That keeps headless
+        PySlater usage and the import-time Flame hook scan cheap.'''
+
+        import flame
 
         project_name = flame.project.current_project.project_name
 
@@ -1130,9 +1437,24 @@ class PySlaterWindow(object):
         else:
             self.html_path_line_edit.setText('')
 
+    def get_output_template_from_line_edits(self):
+        '''Assemble output template from the path and pattern line edits.'''
+
+        self.output_template = os.path.join(
+                self.output_path_line_edit.text(),
+                self.output_pattern_line_edit.text())
+
     def make_slates(self):
         '''Assemble all the attributes and run it.'''
 
+        # Read the line edit widgets once here instead of updating the
+        # attributes on every keystroke.
+        self.get_csv_path()
+        self.get_filter_include()
+        self.get_filter_exclude()
+        self.get_output_template_from_line_edits()
+        self.get_ttg_file_path()
+
         # Run the PySlater class
         self.pys = PySlater(
             csv_file=self.csv_file_path,
@@ -1150,14 +1472,6 @@ class PySlaterWindow(object):
     def main_window(self):
         '''The main GUI window.'''
 
-        def update_output_template():
-            '''Update self.output_template when either of the component line edits are
-            changed.'''
-
-            self.output_template = os.path.join(
-                    self.output_path_line_edit.text(),
-                    self.output_pattern_line_edit.text())
-
         def okay_button():
             '''Okay button pressed.'''
 
@@ -1174,7 +1488,7 @@ class PySlaterWindow(object):
         self.window = QtWidgets.QWidget()
 
         self.window.setMinimumSize(self.window_size['x'], self.window_size['y'])
-        self.window.setStyleSheet('background-color: #272727')
+        self.window.setStyleSheet(STYLESHEET)
         self.window.setWindowTitle(VERSION_TITLE)
 
         # Mac needs this to close the window
@@ -1222,26 +1536,20 @@ class PySlaterWindow(object):
 
         self.csv_path_line_edit = FlameLineEditFileBrowse(
             self.csv_file_path, '*.csv', self.window)
-        self.csv_path_line_edit.textChanged.connect(self.get_csv_path)
 
         self.filter_include_line_edit = FlameLineEdit('')
         self.filter_include_line_edit.setEnabled(False)  # initial state
-        self.filter_include_line_edit.textChanged.connect(self.get_filter_include)
 
         self.filter_exclude_line_edit = FlameLineEdit('')
         self.filter_exclude_line_edit.setEnabled(False)  # initial state
-        self.filter_exclude_line_edit.textChanged.connect(self.get_filter_exclude)
 
         self.output_path_line_edit = FlameLineEditFileBrowse(
             self.default_path, 'dir', self.window)
-        self.output_path_line_edit.textChanged.connect(update_output_template)
 
         self.output_pattern_line_edit = FlameLineEdit(DEFAULT_OUTPUT_TTG)
-        self.output_pattern_line_edit.textChanged.connect(update_output_template)
 
         self.ttg_path_line_edit = FlameLineEditFileBrowse(
             self.ttg_file_path, '*.ttg', self.window)
-        self.ttg_path_line_edit.textChanged.connect(self.get_ttg_file_path)
 
         self.html_path_line_edit = FlameLabel('', 'background')
 